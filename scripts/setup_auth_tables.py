@@ -3,17 +3,7 @@
 
 import psycopg2
 
-conn = psycopg2.connect(
-    host='localhost',
-    port=5433,
-    database='benchmark',
-    user='benchmark',
-    password='benchmark'
-)
-cur = conn.cursor()
-
-# Create users table
-cur.execute('''
+AUTH_DDL = '''
 CREATE TABLE IF NOT EXISTS users (
     id VARCHAR(256) PRIMARY KEY,
     email VARCHAR(256) UNIQUE,
@@ -40,27 +30,42 @@ CREATE TABLE IF NOT EXISTS users (
     api_key_openrouter BYTEA,
     api_key_openai BYTEA,
     api_key_anthropic BYTEA
-)
-''')
+);
 
-# Create sessions table
-cur.execute('''
 CREATE TABLE IF NOT EXISTS sessions (
     id VARCHAR(64) PRIMARY KEY,
     user_id VARCHAR(256) REFERENCES users(id) ON DELETE CASCADE,
     data JSONB DEFAULT '{}',
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     expires_at TIMESTAMP WITH TIME ZONE NOT NULL
-)
-''')
+);
+
+CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at);
+'''
+
+
+def main():
+    conn = psycopg2.connect(
+        host='localhost',
+        port=5433,
+        database='benchmark',
+        user='benchmark',
+        password='benchmark'
+    )
+    cur = conn.cursor()
+
+    # Create users and sessions tables with their indexes in a single round trip
+    cur.execute(AUTH_DDL)
+
+    conn.commit()
+    print('Auth tables created successfully!')
 
-cur.execute('CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id)')
-cur.execute('CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at)')
+    cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
+    tables = cur.fetchall()
+    print('Tables now:', [t[0] for t in tables])
+    conn.close()
 
-conn.commit()
-print('Auth tables created successfully!')
 
-cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
-tables = cur.fetchall()
-print('Tables now:', [t[0] for t in tables])
-conn.close()
+if __name__ == "__main__":
+    main()
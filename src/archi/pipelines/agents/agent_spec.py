@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 import re
 import yaml
 
+try:
+    # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass(frozen=True)
+_SLUG_SEPARATOR_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+@dataclass(frozen=True, slots=True)
 class AgentSpec:
     name: str
-    tools: List[str]
+    tools: Tuple[str, ...]
     prompt: str
     source_path: Path
 
@@ -28,6 +37,14 @@ def list_agent_files(agents_dir: Path) -> List[Path]:
 
 
 def load_agent_spec(path: Path) -> AgentSpec:
+    # Keyed on mtime and size so edits to the file are picked up on the next call
+    stat = path.stat()
+    return _load_agent_spec_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_agent_spec_cached(path_str: str, mtime_ns: int, size: int) -> AgentSpec:
+    path = Path(path_str)
     text = path.read_text()
     frontmatter, prompt = _parse_frontmatter(text, path)
     name, tools = _extract_metadata(frontmatter, path)
@@ -51,7 +68,7 @@ def load_agent_spec_from_text(text: str) -> AgentSpec:
 
 
 def slugify_agent_name(name: str) -> str:
-    slug = re.sub(r"[^A-Za-z0-9]+", "-", name.strip().lower()).strip("-")
+    slug = _SLUG_SEPARATOR_RE.sub("-", name.strip().lower()).strip("-")
     if not slug:
         slug = "agent"
     return f"{slug}.md"
@@ -90,8 +107,12 @@ def _parse_frontmatter(text: str, path: Path) -> Tuple[dict, str]:
     else:
         raise AgentSpecError(f"{path} frontmatter missing closing '---'.")
 
+    frontmatter_text = "\n".join(frontmatter_lines)
+    # libyaml accepts some tab-indented YAML that the pure-Python loader rejects;
+    # use the pure-Python loader there so results don't depend on how PyYAML was built
+    loader = yaml.SafeLoader if "\t" in frontmatter_text else _YamlLoader
     try:
-        frontmatter = yaml.safe_load("\n".join(frontmatter_lines)) or {}
+        frontmatter = yaml.load(frontmatter_text, Loader=loader) or {}
     except Exception as exc:
         raise AgentSpecError(f"{path} invalid YAML frontmatter: {exc}") from exc
 
@@ -101,13 +122,17 @@ def _parse_frontmatter(text: str, path: Path) -> Tuple[dict, str]:
     return frontmatter, prompt
 
 
-def _extract_metadata(frontmatter: dict, path: Path) -> Tuple[str, List[str]]:
+def _extract_metadata(frontmatter: dict, path: Path) -> Tuple[str, Tuple[str, ...]]:
     if not isinstance(frontmatter, dict):
         raise AgentSpecError(f"{path} frontmatter must be a mapping.")
     name = frontmatter.get("name")
     tools = frontmatter.get("tools")
     if not name or not isinstance(name, str):
         raise AgentSpecError(f"{path} frontmatter must include a string 'name'.")
-    if not tools or not isinstance(tools, list) or not all(isinstance(t, str) and t.strip() for t in tools):
+    if not tools or not isinstance(tools, list):
+        raise AgentSpecError(f"{path} frontmatter must include a list 'tools'.")
+    # Non-string entries become "" so a single pass both strips and validates
+    stripped = tuple(t.strip() if isinstance(t, str) else "" for t in tools)
+    if not all(stripped):
         raise AgentSpecError(f"{path} frontmatter must include a list 'tools'.")
-    return name.strip(), [t.strip() for t in tools]
+    return name.strip(), stripped
@@ -1112,13 +1112,14 @@ class BaseReActAgent:
         if not memory:
             return
         # Prefer memory convenience method if available
-        try:
+        record_documents = getattr(memory, "record_documents", None)
+        if record_documents is not None:
             logger.debug("Recording %d documents from stage '%s' via record_documents", len(docs), stage)
-            memory.record_documents(stage, docs)
-        except Exception:
-            # fallback to explicit record + note
-            memory.record(stage, docs)
-            memory.note(f"{stage} returned {len(list(docs))} document(s).")
+            record_documents(stage, docs)
+            return
+        # fallback to explicit record + note
+        memory.record(stage, docs)
+        memory.note(f"{stage} returned {len(docs)} document(s).")
 
     def _store_tool_input(self, tool_name: str, tool_input: Any) -> None:
         """Store runtime tool input so streamed tool ids can be backfilled with arguments."""
@@ -1133,7 +1134,14 @@ class BaseReActAgent:
     def _prepare_inputs(self, history: Any, **kwargs) -> Dict[str, Any]:
         """Create list of messages using LangChain's formatting."""
         history = history or []
-        history_messages = [infer_speaker(msg[0])(msg[1]) for msg in history]
+        # Resolve each distinct speaker once; histories only use a handful of roles
+        message_types: Dict[str, Any] = {}
+        history_messages = []
+        for msg in history:
+            message_type = message_types.get(msg[0])
+            if message_type is None:
+                message_type = message_types[msg[0]] = infer_speaker(msg[0])
+            history_messages.append(message_type(msg[1]))
         return {"history": history_messages}
 
     def _prepare_agent_inputs(self, **kwargs) -> Dict[str, Any]:
@@ -1162,7 +1170,7 @@ class BaseReActAgent:
             last_message = history_messages[-1]
             content = self._message_content(last_message)
             if content:
-                snippet = content if len(content) <= 200 else f"{content[:197]}..."
+                snippet = content if len(content) <= 200 else content[:197] + "..."
                 memory.note(f"Latest user message: {snippet}")
 
         # --- Token trimming based on model context window ---
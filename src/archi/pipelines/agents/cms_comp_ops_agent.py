@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from src.utils.logging import get_logger
 from src.utils.env import read_secret
@@ -23,6 +23,42 @@ from src.archi.pipelines.agents.utils.skill_utils import load_skill
 
 logger = get_logger(__name__)
 
+# Tool descriptions shown to the model, keyed by tool name.
+_TOOL_DESCRIPTIONS: Dict[str, str] = {
+    "search_local_files": (
+        "Grep-like search over file contents. Provide a distinctive phrase or regex; optionally use "
+        "regex=true, case_sensitive=true, and context (before/after). Returns matching lines with hashes; "
+        "use fetch_catalog_document for full text."
+    ),
+    "search_metadata_index": (
+        "Query the files' metadata catalog (ticket IDs, source URLs, resource types, etc.). "
+        "Supports key:value filters and OR (e.g., source_type:git OR url:https://... ticket_id:CMS-123). "
+        "Returns matching files with metadata; use fetch_catalog_document to pull full text."
+    ),
+    "list_metadata_schema": (
+        "List metadata schema hints: supported keys, distinct source_type values, and suffixes. "
+        "Use this to learn which key:value filters are available before searching."
+    ),
+    "fetch_catalog_document": (
+        "Fetch full document text by resource hash after a search hit. "
+        "Use this sparingly to pull only the most relevant files."
+    ),
+    "search_vectorstore_hybrid": (
+        "Hybrid search over the knowledge base that combines lexical (BM25) and semantic (vector) matching.\n"
+        "Input must be a plain text query string.\n"
+        "Query writing guidance:\n"
+        "- Use one short, specific question or request (not a long keyword dump).\n"
+        "- Keep only the most informative terms (about 3-8 keywords or a short sentence).\n"
+        "- Do not repeat terms unless repetition is intentional for emphasis.\n"
+        "- Avoid partial/trailing fragments (e.g., ending with a single character).\n"
+        "- Include exact identifiers when known (component names, APIs, error strings), using quotes for multi-word phrases.\n"
+        "- If results are weak, run a second query that is narrower (add identifiers) or broader (remove overly specific terms)."
+    ),
+    "mcp": "Access tools served via configured MCP servers.",
+    "monit_opensearch_search": "Search MONIT OpenSearch for CMS Rucio events.",
+    "monit_opensearch_aggregation": "Run aggregation queries on MONIT OpenSearch for CMS Rucio events.",
+}
+
 
 class CMSCompOpsAgent(BaseReActAgent):
     """Agent designed for CMS CompOps operations."""
@@ -37,9 +73,15 @@ class CMSCompOpsAgent(BaseReActAgent):
 
         self.catalog_service = RemoteCatalogClient.from_deployment_config(self.config)
         self._vector_retrievers = None
-        self._vector_tool = None
+        self._vector_tools = None
+        self._vector_tools_key = None
         self.enable_vector_tools = "search_vectorstore_hybrid" in self.selected_tool_names
 
+        hybrid_cfg = self.dm_config.get("retrievers", {}).get("hybrid_retriever", {})
+        self._hybrid_k = hybrid_cfg.get("num_documents_to_retrieve", 5)
+        self._hybrid_bm25_weight = hybrid_cfg.get("bm25_weight", 0.6)
+        self._hybrid_semantic_weight = hybrid_cfg.get("semantic_weight", 0.4)
+
         # Initialize MONIT client (shared across search and aggregation tools)
         self._monit_client = None
         self._rucio_events_skill = None
@@ -86,51 +128,27 @@ class CMSCompOpsAgent(BaseReActAgent):
         defs = {
             "search_local_files": {
                 "builder": self._build_file_search_tool,
-                "description": (
-                    "Grep-like search over file contents. Provide a distinctive phrase or regex; optionally use "
-                    "regex=true, case_sensitive=true, and context (before/after). Returns matching lines with hashes; "
-                    "use fetch_catalog_document for full text."
-                ),
+                "description": _TOOL_DESCRIPTIONS["search_local_files"],
             },
             "search_metadata_index": {
                 "builder": self._build_metadata_search_tool,
-                "description": (
-                    "Query the files' metadata catalog (ticket IDs, source URLs, resource types, etc.). "
-                    "Supports key:value filters and OR (e.g., source_type:git OR url:https://... ticket_id:CMS-123). "
-                    "Returns matching files with metadata; use fetch_catalog_document to pull full text."
-                ),
+                "description": _TOOL_DESCRIPTIONS["search_metadata_index"],
             },
             "list_metadata_schema": {
                 "builder": self._build_metadata_schema_tool,
-                "description": (
-                    "List metadata schema hints: supported keys, distinct source_type values, and suffixes. "
-                    "Use this to learn which key:value filters are available before searching."
-                ),
+                "description": _TOOL_DESCRIPTIONS["list_metadata_schema"],
             },
             "fetch_catalog_document": {
                 "builder": self._build_fetch_tool,
-                "description": (
-                    "Fetch full document text by resource hash after a search hit. "
-                    "Use this sparingly to pull only the most relevant files."
-                ),
+                "description": _TOOL_DESCRIPTIONS["fetch_catalog_document"],
             },
             "search_vectorstore_hybrid": {
                 "builder": self._build_vector_tool_placeholder,
-                "description": (
-                    "Hybrid search over the knowledge base that combines lexical (BM25) and semantic (vector) matching.\n"
-                    "Input must be a plain text query string.\n"
-                    "Query writing guidance:\n"
-                    "- Use one short, specific question or request (not a long keyword dump).\n"
-                    "- Keep only the most informative terms (about 3-8 keywords or a short sentence).\n"
-                    "- Do not repeat terms unless repetition is intentional for emphasis.\n"
-                    "- Avoid partial/trailing fragments (e.g., ending with a single character).\n"
-                    "- Include exact identifiers when known (component names, APIs, error strings), using quotes for multi-word phrases.\n"
-                    "- If results are weak, run a second query that is narrower (add identifiers) or broader (remove overly specific terms)."
-                ),
+                "description": _TOOL_DESCRIPTIONS["search_vectorstore_hybrid"],
             },
             "mcp": {
                 "builder": self._build_mcp_tools,
-                "description": "Access tools served via configured MCP servers.",
+                "description": _TOOL_DESCRIPTIONS["mcp"],
             },
         }
 
@@ -140,17 +158,17 @@ class CMSCompOpsAgent(BaseReActAgent):
         if getattr(self, "_monit_client", None) is not None:
             defs["monit_opensearch_search"] = {
                 "builder": self._build_monit_opensearch_search_tool,
-                "description": "Search MONIT OpenSearch for CMS Rucio events.",
+                "description": _TOOL_DESCRIPTIONS["monit_opensearch_search"],
             }
             defs["monit_opensearch_aggregation"] = {
                 "builder": self._build_monit_opensearch_aggregation_tool,
-                "description": "Run aggregation queries on MONIT OpenSearch for CMS Rucio events.",
+                "description": _TOOL_DESCRIPTIONS["monit_opensearch_aggregation"],
             }
 
         return defs
 
     def _build_file_search_tool(self) -> Callable:
-        description = self._tool_definitions()["search_local_files"]["description"]
+        description = _TOOL_DESCRIPTIONS["search_local_files"]
         return create_file_search_tool(
             self.catalog_service,
             description=description,
@@ -159,7 +177,7 @@ class CMSCompOpsAgent(BaseReActAgent):
         )
 
     def _build_metadata_search_tool(self) -> Callable:
-        description = self._tool_definitions()["search_metadata_index"]["description"]
+        description = _TOOL_DESCRIPTIONS["search_metadata_index"]
         return create_metadata_search_tool(
             self.catalog_service,
             description=description,
@@ -168,14 +186,14 @@ class CMSCompOpsAgent(BaseReActAgent):
         )
 
     def _build_metadata_schema_tool(self) -> Callable:
-        description = self._tool_definitions()["list_metadata_schema"]["description"]
+        description = _TOOL_DESCRIPTIONS["list_metadata_schema"]
         return create_metadata_schema_tool(
             self.catalog_service,
             description=description,
         )
 
     def _build_fetch_tool(self) -> Callable:
-        description = self._tool_definitions()["fetch_catalog_document"]["description"]
+        description = _TOOL_DESCRIPTIONS["fetch_catalog_document"]
         return create_document_fetch_tool(
             self.catalog_service,
             description=description,
@@ -221,21 +239,21 @@ class CMSCompOpsAgent(BaseReActAgent):
             self._vector_retrievers = None
             self._vector_tools = None
             return
-        retrievers_cfg = self.dm_config.get("retrievers", {})
-        hybrid_cfg = retrievers_cfg.get("hybrid_retriever", {})
 
-        k = hybrid_cfg.get("num_documents_to_retrieve", 5)
-        bm25_weight = hybrid_cfg.get("bm25_weight", 0.6)
-        semantic_weight = hybrid_cfg.get("semantic_weight", 0.4)
+        # Reuse the existing tool while the backing store is unchanged so the
+        # toolset keeps its identity and refresh_agent() can skip a rebuild.
+        key = self._vectorstore_key(vectorstore)
+        if self._vector_tools is not None and key == self._vector_tools_key:
+            return
 
         hybrid_retriever = HybridRetriever(
             vectorstore=vectorstore,
-            k=k,
-            bm25_weight=bm25_weight,
-            semantic_weight=semantic_weight,
+            k=self._hybrid_k,
+            bm25_weight=self._hybrid_bm25_weight,
+            semantic_weight=self._hybrid_semantic_weight,
         )
 
-        hybrid_description = self._tool_definitions()["search_vectorstore_hybrid"]["description"]
+        hybrid_description = _TOOL_DESCRIPTIONS["search_vectorstore_hybrid"]
 
         self._vector_retrievers = [hybrid_retriever]
         self._vector_tools = []
@@ -248,3 +266,19 @@ class CMSCompOpsAgent(BaseReActAgent):
                 store_tool_input=getattr(self, "_store_tool_input", None),
             )
         )
+        self._vector_tools_key = key
+
+    @staticmethod
+    def _vectorstore_key(vectorstore: Any) -> Tuple[Any, ...]:
+        """Identify the store behind a vectorstore instance.
+
+        A fresh PostgresVectorStore is created per request, but it wraps the same
+        connection settings and embedding model. The cached retriever keeps those
+        objects alive, so their ids cannot be reused while the key is held.
+        """
+        return (
+            id(getattr(vectorstore, "_pg_config", vectorstore)),
+            id(getattr(vectorstore, "embeddings", None)),
+            getattr(vectorstore, "_collection_name", None),
+            getattr(vectorstore, "_distance_metric", None),
+        )
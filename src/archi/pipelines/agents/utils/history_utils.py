@@ -4,11 +4,19 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_SPEAKER_TYPES: dict[str, type[BaseMessage]] = {
+    "user": HumanMessage,
+    "human": HumanMessage,
+    "agent": AIMessage,
+    "ai": AIMessage,
+    "assistant": AIMessage,
+    "archi": AIMessage,
+}
+
 def infer_speaker(speaker: str) -> type[BaseMessage]:
     """Infer the speaker type and return the appropriate message class."""
-    if speaker.lower() in ["user", "human"]:
-        return HumanMessage
-    if speaker.lower() in ["agent", "ai", "assistant", "archi"]:
-        return AIMessage
+    message_type = _SPEAKER_TYPES.get(speaker.lower())
+    if message_type is not None:
+        return message_type
     logger.warning("Unknown speaker type: %s. Defaulting to HumanMessage.", speaker)
-    return HumanMessage
\ No newline at end of file
+    return HumanMessage
@@ -61,8 +61,7 @@ class AsyncLoopThread:
 
     def in_loop_thread(self) -> bool:
         """Return True if called from the background event-loop thread."""
-        return threading.current_thread() is self.thread
-        # or: return threading.get_ident() == self.thread.ident
+        return threading.get_ident() == self.thread.ident
 
     @classmethod
     def get_instance(cls) -> "AsyncLoopThread":
@@ -15,8 +15,9 @@ Usage:
     providers = list_enabled_providers()
 """
 
+import importlib
 import os
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 
 from src.archi.providers.base import (
     BaseProvider,
@@ -64,23 +65,36 @@ def register_provider(provider_type: ProviderType, provider_class: Type[BaseProv
     _PROVIDER_REGISTRY[provider_type] = provider_class
 
 
+# Built-in providers, imported on first use so that requesting one provider
+# does not pull in every other provider's SDK.
+_BUILTIN_PROVIDERS: Dict[ProviderType, Tuple[str, str]] = {
+    ProviderType.OPENAI: ("src.archi.providers.openai_provider", "OpenAIProvider"),
+    ProviderType.ANTHROPIC: ("src.archi.providers.anthropic_provider", "AnthropicProvider"),
+    ProviderType.GEMINI: ("src.archi.providers.gemini_provider", "GeminiProvider"),
+    ProviderType.OPENROUTER: ("src.archi.providers.openrouter_provider", "OpenRouterProvider"),
+    ProviderType.LOCAL: ("src.archi.providers.local_provider", "LocalProvider"),
+}
+
+
+def _get_provider_class(provider_type: ProviderType) -> Optional[Type[BaseProvider]]:
+    """Return the provider class, importing a built-in provider only when first requested."""
+    provider_class = _PROVIDER_REGISTRY.get(provider_type)
+    if provider_class is None and provider_type in _BUILTIN_PROVIDERS:
+        module_name, class_name = _BUILTIN_PROVIDERS[provider_type]
+        provider_class = getattr(importlib.import_module(module_name), class_name)
+        register_provider(provider_type, provider_class)
+    return provider_class
+
+
 def _ensure_providers_registered() -> None:
-    """Lazily register all built-in providers."""
-    if _PROVIDER_REGISTRY:
-        return
-    
-    # Import and register all providers
-    from src.archi.providers.openai_provider import OpenAIProvider
-    from src.archi.providers.anthropic_provider import AnthropicProvider
-    from src.archi.providers.gemini_provider import GeminiProvider
-    from src.archi.providers.openrouter_provider import OpenRouterProvider
-    from src.archi.providers.local_provider import LocalProvider
-    
-    register_provider(ProviderType.OPENAI, OpenAIProvider)
-    register_provider(ProviderType.ANTHROPIC, AnthropicProvider)
-    register_provider(ProviderType.GEMINI, GeminiProvider)
-    register_provider(ProviderType.OPENROUTER, OpenRouterProvider)
-    register_provider(ProviderType.LOCAL, LocalProvider)
+    """Register all built-in providers."""
+    for provider_type in _BUILTIN_PROVIDERS:
+        _get_provider_class(provider_type)
+
+
+def _registered_provider_types() -> List[ProviderType]:
+    """Registered provider types in declaration order."""
+    return [provider_type for provider_type in ProviderType if provider_type in _PROVIDER_REGISTRY]
 
 
 def get_provider(
@@ -102,8 +116,6 @@ def get_provider(
     Raises:
         ValueError: If the provider type is unknown
     """
-    _ensure_providers_registered()
-    
     # Convert string to ProviderType if needed
     if isinstance(provider_type, str):
         try:
@@ -114,7 +126,8 @@ def get_provider(
                 f"Available: {[p.value for p in ProviderType]}"
             )
     
-    if provider_type not in _PROVIDER_REGISTRY:
+    provider_class = _get_provider_class(provider_type)
+    if provider_class is None:
         raise ValueError(f"No provider registered for type: {provider_type}")
     
     config = _ensure_provider_config_api_key_env(provider_type, config)
@@ -124,7 +137,6 @@ def get_provider(
         return _PROVIDER_INSTANCES[provider_type]
     
     # Create new instance
-    provider_class = _PROVIDER_REGISTRY[provider_type]
     provider = provider_class(config)
     
     # Cache if using default config
@@ -185,7 +197,7 @@ def get_provider_by_name(name: str, **kwargs) -> BaseProvider:
 def list_provider_types() -> List[ProviderType]:
     """List all registered provider types."""
     _ensure_providers_registered()
-    return list(_PROVIDER_REGISTRY.keys())
+    return _registered_provider_types()
 
 
 def list_enabled_providers() -> List[BaseProvider]:
@@ -200,7 +212,7 @@ def list_enabled_providers() -> List[BaseProvider]:
     _ensure_providers_registered()
     
     enabled = []
-    for provider_type in _PROVIDER_REGISTRY.keys():
+    for provider_type in _registered_provider_types():
         try:
             provider = get_provider(provider_type)
             if provider.is_enabled:
@@ -211,7 +223,7 @@ def list_enabled_providers() -> List[BaseProvider]:
     return enabled
 
 
-def list_all_models() -> Dict[str, List[ModelInfo]]:
+def list_all_models() -> Dict[str, Sequence[ModelInfo]]:
     """
     List all models from all enabled providers.
     
@@ -293,8 +305,6 @@ def get_provider_with_api_key(
     Returns:
         A provider instance configured with the specified API key
     """
-    _ensure_providers_registered()
-    
     # Convert string to ProviderType if needed
     if isinstance(provider_type, str):
         try:
@@ -305,11 +315,11 @@ def get_provider_with_api_key(
                 f"Available: {[p.value for p in ProviderType]}"
             )
     
-    if provider_type not in _PROVIDER_REGISTRY:
+    provider_class = _get_provider_class(provider_type)
+    if provider_class is None:
         raise ValueError(f"No provider registered for type: {provider_type}")
     
     # Create new instance with custom config containing the API key
-    provider_class = _PROVIDER_REGISTRY[provider_type]
     config = ProviderConfig(
         provider_type=provider_type,
         api_key=api_key,
@@ -1,6 +1,6 @@
 """Anthropic provider implementation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from langchain_anthropic import ChatAnthropic
 
@@ -16,7 +16,7 @@ logger = get_logger(__name__)
 
 
 # Default models available from Anthropic
-DEFAULT_ANTHROPIC_MODELS = [
+DEFAULT_ANTHROPIC_MODELS: Tuple[ModelInfo, ...] = (
     ModelInfo(
         id="claude-sonnet-4-20250514",
         name="claude-sonnet-4-20250514",
@@ -57,7 +57,7 @@ DEFAULT_ANTHROPIC_MODELS = [
         supports_vision=True,
         max_output_tokens=4096,
     ),
-]
+)
 
 
 class AnthropicProvider(BaseProvider):
@@ -85,8 +85,8 @@ class AnthropicProvider(BaseProvider):
             **kwargs,
         }
         
-        if self._api_key:
-            model_kwargs["api_key"] = self._api_key
+        if self.api_key:
+            model_kwargs["api_key"] = self.api_key
         
         # Anthropic requires max_tokens to be set
         if "max_tokens" not in model_kwargs:
@@ -98,7 +98,7 @@ class AnthropicProvider(BaseProvider):
             
         return ChatAnthropic(**model_kwargs)
     
-    def list_models(self) -> List[ModelInfo]:
+    def list_models(self) -> Sequence[ModelInfo]:
         """List available Anthropic models."""
         if self.config.models:
             return self.config.models
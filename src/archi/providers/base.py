@@ -8,7 +8,7 @@ This module provides a unified interface for working with different LLM provider
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Sequence, Type
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
@@ -27,7 +27,7 @@ class ProviderType(str, Enum):
     LOCAL = "local"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInfo:
     """Information about a specific model offered by a provider."""
     id: str
@@ -52,7 +52,7 @@ class ModelInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """Configuration for a model provider."""
     provider_type: ProviderType
@@ -60,9 +60,14 @@ class ProviderConfig:
     api_key: Optional[str] = None
     base_url: Optional[str] = None
     enabled: bool = True
-    models: List[ModelInfo] = field(default_factory=list)
+    models: Sequence[ModelInfo] = field(default_factory=tuple)
     default_model: Optional[str] = None
     extra_kwargs: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self) -> None:
+        # Frozen so the model list can only change by assigning a new one,
+        # which BaseProvider.get_model_info detects by identity
+        self.models = tuple(self.models)
 
 
 class BaseProvider(ABC):
@@ -81,8 +86,11 @@ class BaseProvider(ABC):
     
     def __init__(self, config: ProviderConfig):
         self.config = config
+        # The key is resolved on first access so unused providers never read secrets
         self._api_key: Optional[str] = None
-        self._load_api_key()
+        self._api_key_loaded = False
+        self._model_index: Dict[str, ModelInfo] = {}
+        self._model_index_source: Optional[Sequence[ModelInfo]] = None
     
     def _load_api_key(self) -> None:
         """Load API key from config or environment."""
@@ -90,16 +98,20 @@ class BaseProvider(ABC):
             self._api_key = self.config.api_key
         elif self.config.api_key_env:
             self._api_key = read_secret(self.config.api_key_env)
+        self._api_key_loaded = True
     
     @property
     def api_key(self) -> Optional[str]:
         """Get the API key for this provider."""
+        if not self._api_key_loaded:
+            self._load_api_key()
         return self._api_key
     
     @api_key.setter
     def api_key(self, value: Optional[str]) -> None:
         """Set the API key for this provider dynamically."""
         self._api_key = value
+        self._api_key_loaded = True
     
     def set_api_key(self, api_key: str) -> None:
         """
@@ -112,6 +124,7 @@ class BaseProvider(ABC):
             api_key: The API key to use for this provider
         """
         self._api_key = api_key
+        self._api_key_loaded = True
     
     @property
     def is_configured(self) -> bool:
@@ -119,7 +132,7 @@ class BaseProvider(ABC):
         # Local providers may not need an API key
         if self.provider_type == ProviderType.LOCAL:
             return bool(self.config.base_url)
-        return bool(self._api_key)
+        return bool(self.api_key)
     
     @property
     def is_enabled(self) -> bool:
@@ -141,21 +154,28 @@ class BaseProvider(ABC):
         pass
     
     @abstractmethod
-    def list_models(self) -> List[ModelInfo]:
+    def list_models(self) -> Sequence[ModelInfo]:
         """
         List all available models for this provider.
         
         Returns:
-            List of ModelInfo objects describing available models
+            Sequence of ModelInfo objects describing available models
         """
         pass
     
     def get_model_info(self, model_name: str) -> Optional[ModelInfo]:
         """Get information about a specific model."""
-        for model in self.list_models():
-            if model.id == model_name or model.name == model_name:
-                return model
-        return None
+        models = self.list_models()
+        # Rebuild the id/name index only when list_models() hands back a different
+        # sequence; config.models is a tuple, so changing it means assigning a new one
+        if models is not self._model_index_source:
+            index: Dict[str, ModelInfo] = {}
+            for model in models:
+                index.setdefault(model.id, model)
+                index.setdefault(model.name, model)
+            self._model_index = index
+            self._model_index_source = models
+        return self._model_index.get(model_name)
     
     def validate_connection(self) -> bool:
         """
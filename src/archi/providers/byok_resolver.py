@@ -16,6 +16,16 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Provider types by lowercase value, so string inputs resolve without try/except
+_PROVIDER_TYPES_BY_VALUE: Dict[str, ProviderType] = {p.value: p for p in ProviderType}
+
+
+def _coerce_provider_type(provider_type: str | ProviderType) -> Optional[ProviderType]:
+    """Return the ProviderType for a string or enum, or None if unknown."""
+    if isinstance(provider_type, ProviderType):
+        return provider_type
+    return _PROVIDER_TYPES_BY_VALUE.get(provider_type.lower())
+
 
 class BYOKResolver:
     """
@@ -84,15 +94,8 @@ class BYOKResolver:
             logger.debug("UserService not available, BYOK lookup skipped")
             return None
         
-        # Convert to ProviderType
-        if isinstance(provider_type, str):
-            try:
-                provider_type = ProviderType(provider_type.lower())
-            except ValueError:
-                return None
-        
         # Get BYOK provider name
-        byok_provider = self.PROVIDER_TO_BYOK.get(provider_type)
+        byok_provider = self.PROVIDER_TO_BYOK.get(_coerce_provider_type(provider_type))
         if byok_provider is None:
             logger.debug(f"Provider {provider_type} does not support BYOK")
             return None
@@ -136,7 +139,7 @@ class BYOKResolver:
             # Create provider with BYOK key
             # Don't use cache for user-specific keys
             config = ProviderConfig(
-                provider_type=ProviderType(provider_type) if isinstance(provider_type, str) else provider_type,
+                provider_type=_coerce_provider_type(provider_type),
                 api_key=byok_key,
                 **kwargs.get("config_kwargs", {}),
             )
@@ -1,6 +1,6 @@
 """Google Gemini provider implementation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from src.archi.providers.base import (
     BaseProvider,
@@ -14,7 +14,7 @@ logger = get_logger(__name__)
 
 
 # Default models available from Google Gemini
-DEFAULT_GEMINI_MODELS = [
+DEFAULT_GEMINI_MODELS: Tuple[ModelInfo, ...] = (
     ModelInfo(
         id="gemini-2.0-flash",
         name="gemini-2.0-flash",
@@ -55,7 +55,7 @@ DEFAULT_GEMINI_MODELS = [
         supports_vision=True,
         max_output_tokens=8192,
     ),
-]
+)
 
 
 class GeminiProvider(BaseProvider):
@@ -91,12 +91,12 @@ class GeminiProvider(BaseProvider):
             **kwargs,
         }
         
-        if self._api_key:
-            model_kwargs["google_api_key"] = self._api_key
+        if self.api_key:
+            model_kwargs["google_api_key"] = self.api_key
             
         return ChatGoogleGenerativeAI(**model_kwargs)
     
-    def list_models(self) -> List[ModelInfo]:
+    def list_models(self) -> Sequence[ModelInfo]:
         """List available Gemini models."""
         if self.config.models:
             return self.config.models
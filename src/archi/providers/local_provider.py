@@ -1,6 +1,8 @@
 """Local provider implementation for Ollama and OpenAI-compatible local servers."""
 
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
@@ -31,10 +33,41 @@ class LocalProvider(BaseProvider):
     
     DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
     DEFAULT_OPENAI_COMPAT_BASE_URL = "http://localhost:8000/v1"
+    # Installed Ollama models are served from cache and refreshed in the background once stale
+    OLLAMA_MODELS_TTL_SECONDS = 30.0
+
+    # Keep-alive session shared by all instances, created on first request
+    _http_session = None
+    _http_session_lock = threading.Lock()
+
+    # Installed Ollama models per base_url as (fetched_at, models), shared by all
+    # instances since a fresh provider is built for each request. Tuples, so callers
+    # cannot modify the shared list
+    _ollama_models_cache: Dict[str, Tuple[float, Tuple[ModelInfo, ...]]] = {}
+    _ollama_refreshing: Set[str] = set()
+    _ollama_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_http_session(cls):
+        """Return the shared requests.Session used to talk to local servers."""
+        session = cls._http_session
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            with cls._http_session_lock:
+                if cls._http_session is None:
+                    new_session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                    new_session.mount("http://", adapter)
+                    new_session.mount("https://", adapter)
+                    cls._http_session = new_session
+                session = cls._http_session
+        return session
 
     @staticmethod
     def _normalize_base_url(url: Optional[str]) -> Optional[str]:
-        """Ensure the base URL has a scheme so urllib requests succeed."""
+        """Ensure the base URL has a scheme so HTTP requests succeed."""
         if not url:
             return url
         if url.startswith(("http://", "https://")):
@@ -117,14 +150,14 @@ class LocalProvider(BaseProvider):
             "base_url": base_url,
             "streaming": True,
             # Most local servers don't require an API key, but some do
-            "api_key": self._api_key or "not-needed",
+            "api_key": self.api_key or "not-needed",
             **{k: v for k, v in self.config.extra_kwargs.items() if k != "local_mode"},
             **kwargs,
         }
         
         return ChatOpenAI(**model_kwargs)
     
-    def list_models(self) -> List[ModelInfo]:
+    def list_models(self) -> Sequence[ModelInfo]:
         """
         List available local models.
 
@@ -142,61 +175,104 @@ class LocalProvider(BaseProvider):
             return self.config.models
         return []
     
-    def _fetch_ollama_models(self) -> List[ModelInfo]:
+    def _fetch_ollama_models(self) -> Sequence[ModelInfo]:
+        """
+        Return installed Ollama models, using the cached list when available.
+        
+        A stale cache is returned immediately while a background refresh runs;
+        failed refreshes keep the previous list. Returns empty list if nothing
+        has been fetched successfully yet.
+        """
+        base_url = self.config.base_url or self.DEFAULT_OLLAMA_BASE_URL
+        cached = self._ollama_models_cache.get(base_url)
+        if cached is None:
+            return self._refresh_ollama_models(base_url) or ()
+        fetched_at, models = cached
+        if time.monotonic() - fetched_at >= self.OLLAMA_MODELS_TTL_SECONDS:
+            with self._ollama_cache_lock:
+                start_refresh = base_url not in self._ollama_refreshing
+                if start_refresh:
+                    self._ollama_refreshing.add(base_url)
+            if start_refresh:
+                threading.Thread(
+                    target=self._refresh_ollama_models_in_background,
+                    args=(base_url,),
+                    daemon=True,
+                    name="ollama-models-refresh",
+                ).start()
+        return models
+    
+    def _refresh_ollama_models_in_background(self, base_url: str) -> None:
+        """Refresh the cached model list; only one refresh runs per base_url at a time."""
+        try:
+            self._refresh_ollama_models(base_url)
+        finally:
+            with self._ollama_cache_lock:
+                self._ollama_refreshing.discard(base_url)
+    
+    def _refresh_ollama_models(self, base_url: str) -> Optional[Tuple[ModelInfo, ...]]:
+        """Query Ollama and update the cache. Returns None if the fetch fails."""
+        fetched = self._query_ollama_models(base_url)
+        if fetched is None:
+            return None
+        models = tuple(fetched)
+        with self._ollama_cache_lock:
+            self._ollama_models_cache[base_url] = (time.monotonic(), models)
+        return models
+    
+    def _query_ollama_models(self, base_url: str) -> Optional[List[ModelInfo]]:
         """
         Fetch installed models from Ollama API and convert to ModelInfo objects.
         
-        Returns empty list if fetch fails.
+        Returns None if fetch fails.
         """
-        import json
-        import urllib.request
-        import urllib.error
+        import requests
         
         try:
-            base_url = self.config.base_url or self.DEFAULT_OLLAMA_BASE_URL
             logger.debug(f"[LocalProvider] Fetching Ollama models from {base_url}")
             url = f"{base_url}/api/tags"
             
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    models = []
-                    for model_data in data.get("models", []):
-                        name = model_data.get("name", "")
-                        # Extract parameter size if available
-                        details = model_data.get("details", {})
-                        param_size = details.get("parameter_size", "")
-                        family = details.get("family", "")
-                        
-                        # Create a user-friendly display name
-                        display_name = name
-                        if param_size:
-                            display_name = f"{name} ({param_size})"
-                        
-                        # Infer capabilities from model family
-                        supports_tools = family.lower() in ["qwen2", "llama", "mistral"]
-                        supports_vision = "vision" in name.lower() or "vl" in name.lower()
-                        
-                        models.append(ModelInfo(
-                            id=name,
-                            name=name,
-                            display_name=display_name,
-                            context_window=32768,  # Default, actual varies by model
-                            supports_tools=supports_tools,
-                            supports_streaming=True,
-                            supports_vision=supports_vision,
-                            max_output_tokens=8192,
-                        ))
-                    logger.debug(
-                        f"[LocalProvider] Discovered {len(models)} models from Ollama: "
-                        f"{[m.id for m in models]}"
-                    )
-                    return models
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError, json.JSONDecodeError) as e:
-            logger.warning(f"[LocalProvider] Failed to fetch Ollama models from {self.config.base_url}: {e}")
+            response = self._get_http_session().get(url, timeout=10)
+            # Surface 4xx/5xx as RequestException so they are logged below
+            response.raise_for_status()
+            if response.status_code == 200:
+                data = response.json()
+                models = []
+                for model_data in data.get("models", []):
+                    name = model_data.get("name", "")
+                    # Extract parameter size if available
+                    details = model_data.get("details", {})
+                    param_size = details.get("parameter_size", "")
+                    family = details.get("family", "")
+                    
+                    # Create a user-friendly display name
+                    display_name = name
+                    if param_size:
+                        display_name = f"{name} ({param_size})"
+                    
+                    # Infer capabilities from model family
+                    supports_tools = family.lower() in ["qwen2", "llama", "mistral"]
+                    supports_vision = "vision" in name.lower() or "vl" in name.lower()
+                    
+                    models.append(ModelInfo(
+                        id=name,
+                        name=name,
+                        display_name=display_name,
+                        context_window=32768,  # Default, actual varies by model
+                        supports_tools=supports_tools,
+                        supports_streaming=True,
+                        supports_vision=supports_vision,
+                        max_output_tokens=8192,
+                    ))
+                logger.debug(
+                    f"[LocalProvider] Discovered {len(models)} models from Ollama: "
+                    f"{[m.id for m in models]}"
+                )
+                return models
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"[LocalProvider] Failed to fetch Ollama models from {base_url}: {e}")
         
-        return []
+        return None
     
     def validate_connection(self) -> bool:
         """
@@ -205,8 +281,7 @@ class LocalProvider(BaseProvider):
         For Ollama, checks if the server is running by hitting the /api/tags endpoint.
         For OpenAI-compatible, checks the /models endpoint.
         """
-        import urllib.request
-        import urllib.error
+        import requests
         
         try:
             if self.local_mode == "ollama":
@@ -216,10 +291,9 @@ class LocalProvider(BaseProvider):
                 base_url = self.config.base_url or self.DEFAULT_OPENAI_COMPAT_BASE_URL
                 url = f"{base_url}/models"
             
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                return response.status == 200
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
+            response = self._get_http_session().get(url, timeout=5)
+            return response.status_code == 200
+        except requests.RequestException as e:
             logger.warning(f"Local server connection failed: {e}")
             return False
     
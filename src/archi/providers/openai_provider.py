@@ -1,6 +1,6 @@
 """OpenAI provider implementation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from langchain_openai import ChatOpenAI
 
@@ -16,7 +16,7 @@ logger = get_logger(__name__)
 
 
 # Default models available from OpenAI
-DEFAULT_OPENAI_MODELS = [
+DEFAULT_OPENAI_MODELS: Tuple[ModelInfo, ...] = (
     ModelInfo(
         id="gpt-5",
         name="gpt-5",
@@ -97,7 +97,7 @@ DEFAULT_OPENAI_MODELS = [
         supports_vision=False,
         max_output_tokens=65536,
     ),
-]
+)
 
 
 class OpenAIProvider(BaseProvider):
@@ -138,15 +138,15 @@ class OpenAIProvider(BaseProvider):
         if isinstance(model_kwargs.get("stream_options"), dict) or "stream_options" not in model_kwargs:
             model_kwargs["stream_options"] = merged_stream_options
         
-        if self._api_key:
-            model_kwargs["api_key"] = self._api_key
+        if self.api_key:
+            model_kwargs["api_key"] = self.api_key
             
         if self.config.base_url:
             model_kwargs["base_url"] = self.config.base_url
             
         return ChatOpenAI(**model_kwargs)
     
-    def list_models(self) -> List[ModelInfo]:
+    def list_models(self) -> Sequence[ModelInfo]:
         """List available OpenAI models."""
         if self.config.models:
             return self.config.models
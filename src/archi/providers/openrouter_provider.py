@@ -1,7 +1,7 @@
 """OpenRouter provider implementation."""
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from langchain_openai import ChatOpenAI
 
@@ -17,7 +17,7 @@ logger = get_logger(__name__)
 
 
 # Popular models available via OpenRouter
-DEFAULT_OPENROUTER_MODELS = [
+DEFAULT_OPENROUTER_MODELS: Tuple[ModelInfo, ...] = (
     ModelInfo(
         id="anthropic/claude-sonnet-4",
         name="anthropic/claude-sonnet-4",
@@ -98,7 +98,7 @@ DEFAULT_OPENROUTER_MODELS = [
         supports_vision=False,
         max_output_tokens=8192,
     ),
-]
+)
 
 
 class OpenRouterProvider(BaseProvider):
@@ -123,6 +123,20 @@ class OpenRouterProvider(BaseProvider):
                 default_model="anthropic/claude-3.5-sonnet",
             )
         super().__init__(config)
+        # OpenRouter attribution headers, read from the environment once per provider
+        self._default_headers = self._build_default_headers()
+    
+    @staticmethod
+    def _build_default_headers() -> Dict[str, str]:
+        """Build the OpenRouter-specific HTTP-Referer / X-Title headers."""
+        headers = {}
+        site_url = os.getenv("OPENROUTER_SITE_URL")
+        app_name = os.getenv("OPENROUTER_APP_NAME", "archi")
+        if site_url:
+            headers["HTTP-Referer"] = site_url
+        if app_name:
+            headers["X-Title"] = app_name
+        return headers
     
     def get_chat_model(self, model_name: str, **kwargs) -> ChatOpenAI:
         """Get an OpenRouter chat model instance."""
@@ -134,23 +148,16 @@ class OpenRouterProvider(BaseProvider):
             **kwargs,
         }
         
-        if self._api_key:
-            model_kwargs["api_key"] = self._api_key
+        if self.api_key:
+            model_kwargs["api_key"] = self.api_key
         
         # Add OpenRouter-specific headers
-        headers = {}
-        site_url = os.getenv("OPENROUTER_SITE_URL")
-        app_name = os.getenv("OPENROUTER_APP_NAME", "archi")
-        if site_url:
-            headers["HTTP-Referer"] = site_url
-        if app_name:
-            headers["X-Title"] = app_name
-        if headers:
-            model_kwargs["default_headers"] = headers
+        if self._default_headers:
+            model_kwargs["default_headers"] = dict(self._default_headers)
             
         return ChatOpenAI(**model_kwargs)
     
-    def list_models(self) -> List[ModelInfo]:
+    def list_models(self) -> Sequence[ModelInfo]:
         """List available OpenRouter models."""
         if self.config.models:
             return self.config.models
@@ -9,7 +9,7 @@ import nltk
 import psycopg2
 import psycopg2.extras
 from .loader_utils import select_loader
-from .postgres_vectorstore import PostgresVectorStore
+from .postgres_vectorstore import CHUNK_INSERT_PAGE_SIZE, PostgresVectorStore
 from langchain_text_splitters.character import CharacterTextSplitter
 
 from src.data_manager.collectors.utils.catalog_postgres import PostgresCatalogService
@@ -419,6 +419,7 @@ class VectorStoreManager:
                             """,
                             insert_data,
                             template="(%s, %s, %s, %s::vector, %s::jsonb)",
+                            page_size=CHUNK_INSERT_PAGE_SIZE,
                         )
                         logger.debug(f"Added {len(insert_data)} chunks for {filename} (document_id={document_id})")
 
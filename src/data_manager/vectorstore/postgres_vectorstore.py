@@ -21,6 +21,10 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Rows per INSERT statement for chunk batches. psycopg2's default of 100
+# splits typical per-file batches into several round trips.
+CHUNK_INSERT_PAGE_SIZE = 1000
+
 
 class PostgresVectorStore(VectorStore):
     """
@@ -177,6 +181,7 @@ class PostgresVectorStore(VectorStore):
                     """,
                     insert_data,
                     template="(%s, %s, %s, %s::vector, %s::jsonb)",
+                    page_size=CHUNK_INSERT_PAGE_SIZE,
                 )
                 conn.commit()
                 logger.debug("Inserted %d chunks", len(insert_data))
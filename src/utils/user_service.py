@@ -10,9 +10,11 @@ Implements the Users Table requirements from the consolidate-to-postgres spec:
 
 from __future__ import annotations
 
+import hashlib
+import threading
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import psycopg2
 import psycopg2.extras
@@ -28,6 +30,36 @@ AUTH_PROVIDERS = ("anonymous", "basic", "sso")
 # Supported API key providers for BYOK
 BYOK_PROVIDERS = ("openrouter", "openai", "anthropic")
 
+# Decrypted BYOK keys, shared by every UserService in the process and keyed by
+# (user_id, provider, encryption key fingerprint). Each entry remembers
+# users.updated_at from when it was decrypted; get_api_key sends that value with
+# its query and Postgres only decrypts again if the row has changed, so keys set
+# or revoked through another instance or worker are never used stale. Missing
+# keys are not cached.
+API_KEY_CACHE_MAX_ENTRIES = 1024
+_API_KEY_CACHE: Dict[Tuple[str, str, str], Tuple[Any, str]] = {}
+_API_KEY_CACHE_LOCK = threading.Lock()
+
+
+def _cache_api_key(cache_key: Tuple[str, str, str], updated_at: Any, api_key: str) -> None:
+    """Remember a decrypted API key together with the row's updated_at."""
+    with _API_KEY_CACHE_LOCK:
+        if len(_API_KEY_CACHE) >= API_KEY_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry
+            _API_KEY_CACHE.pop(next(iter(_API_KEY_CACHE)))
+        _API_KEY_CACHE[cache_key] = (updated_at, api_key)
+
+
+def _invalidate_api_keys(user_id: str, provider: Optional[str] = None) -> None:
+    """Drop cached API keys for a user, for one provider or all of them."""
+    with _API_KEY_CACHE_LOCK:
+        stale = [
+            key for key in _API_KEY_CACHE
+            if key[0] == user_id and (provider is None or key[1] == provider)
+        ]
+        for key in stale:
+            del _API_KEY_CACHE[key]
+
 
 @dataclass
 class User:
@@ -83,6 +115,8 @@ class UserService:
         self._pool = connection_pool
         self._pg_config = pg_config
         self._encryption_key = encryption_key or read_secret("BYOK_ENCRYPTION_KEY", default="")
+        # Cached keys are tied to the encryption key without keeping it in the cache
+        self._encryption_key_id = hashlib.sha256(self._encryption_key.encode("utf-8")).hexdigest()
         
         if not self._encryption_key:
             logger.warning(
@@ -352,6 +386,7 @@ class UserService:
                 if cursor.rowcount == 0:
                     raise ValueError(f"User not found: {user_id}")
                 
+                _invalidate_api_keys(user_id, provider)
                 logger.info(f"Stored encrypted API key for user {user_id}, provider {provider}")
                 return True
         finally:
@@ -381,30 +416,43 @@ class UserService:
         if not self._encryption_key:
             raise ValueError("BYOK_ENCRYPTION_KEY not configured - cannot retrieve API keys")
         
+        cache_key = (user_id, provider, self._encryption_key_id)
+        cached = _API_KEY_CACHE.get(cache_key)
         column = f"api_key_{provider}"
         
         conn = self._get_connection()
         try:
             with conn.cursor() as cursor:
-                # Use pgcrypto pgp_sym_decrypt for decryption
+                # Use pgcrypto pgp_sym_decrypt for decryption, skipped when the row
+                # is unchanged since the cached key was decrypted
                 cursor.execute(
                     f"""
-                    SELECT pgp_sym_decrypt({column}, %s) as decrypted_key
+                    SELECT updated_at,
+                           CASE WHEN updated_at IS DISTINCT FROM %s
+                                THEN pgp_sym_decrypt({column}, %s)
+                           END as decrypted_key
                     FROM users
                     WHERE id = %s AND {column} IS NOT NULL
                     """,
-                    (self._encryption_key, user_id)
+                    (cached[0] if cached else None, self._encryption_key, user_id)
                 )
                 row = cursor.fetchone()
                 
-                if row is None:
-                    return None
+                api_key = None
+                if row is not None:
+                    updated_at, api_key = row
+                    if cached is not None and updated_at == cached[0]:
+                        return cached[1]
+                    # pgp_sym_decrypt returns bytes, decode to string
+                    if isinstance(api_key, (bytes, memoryview)):
+                        api_key = bytes(api_key).decode("utf-8") if api_key else None
                 
-                # pgp_sym_decrypt returns bytes, decode to string
-                decrypted = row[0]
-                if isinstance(decrypted, (bytes, memoryview)):
-                    return decrypted.decode("utf-8") if decrypted else None
-                return decrypted
+                if api_key:
+                    _cache_api_key(cache_key, updated_at, api_key)
+                elif cached is not None:
+                    with _API_KEY_CACHE_LOCK:
+                        _API_KEY_CACHE.pop(cache_key, None)
+                return api_key
         finally:
             self._release_connection(conn)
     
@@ -442,6 +490,7 @@ class UserService:
                 )
                 conn.commit()
                 
+                _invalidate_api_keys(user_id, provider)
                 logger.info(f"Deleted API key for user {user_id}, provider {provider}")
                 return cursor.rowcount > 0
         finally:
@@ -569,6 +618,8 @@ class UserService:
                 
                 conn.commit()
                 
+                _invalidate_api_keys(anonymous_id)
+                _invalidate_api_keys(authenticated_id)
                 logger.info(
                     f"Linked anonymous user {anonymous_id} to authenticated user {authenticated_id}"
                 )
@@ -285,10 +285,9 @@ BEGIN
             USING bm25(chunk_text) WITH (text_config=''english'')';
         RAISE NOTICE 'BM25 index created on document_chunks';
     ELSE
-        -- Fallback: create GIN index on tsvector for basic full-text search
-        EXECUTE 'ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS chunk_tsv tsvector 
-            GENERATED ALWAYS AS (to_tsvector(''english'', chunk_text)) STORED';
-        EXECUTE 'CREATE INDEX IF NOT EXISTS idx_chunks_fts ON document_chunks USING gin(chunk_tsv)';
+        -- Fallback: expression GIN index for basic full-text search (no stored tsvector column)
+        EXECUTE 'CREATE INDEX IF NOT EXISTS idx_chunks_fts ON document_chunks 
+            USING gin(to_tsvector(''english'', chunk_text))';
         RAISE NOTICE 'Fallback GIN tsvector index created (pg_textsearch not available)';
     END IF;
 END $$;
@@ -0,0 +1,133 @@
+"""
+Unit tests for agent markdown spec parsing.
+
+Tests cover:
+- YAML frontmatter delimiters and line separators
+- Metadata validation
+- Reloading specs after the file changes
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.archi.pipelines.agents.agent_spec import (
+    AgentSpecError,
+    list_agent_files,
+    load_agent_spec,
+    load_agent_spec_from_text,
+)
+
+SPEC = "---\nname: Helper\ntools:\n  - search\n  - fetch\n---\nYou are helpful.\n"
+
+
+class TestFrontmatter:
+    """Test frontmatter delimiter handling."""
+
+    def test_basic_spec(self):
+        spec = load_agent_spec_from_text(SPEC)
+        assert spec.name == "Helper"
+        assert spec.tools == ("search", "fetch")
+        assert spec.prompt == "You are helpful."
+
+    def test_leading_blank_lines(self):
+        spec = load_agent_spec_from_text("\n  \n\t\n" + SPEC)
+        assert spec.name == "Helper"
+
+    def test_crlf_line_endings(self):
+        spec = load_agent_spec_from_text(SPEC.replace("\n", "\r\n") + "Second line.\r\n")
+        assert spec.tools == ("search", "fetch")
+        assert spec.prompt == "You are helpful.\nSecond line."
+
+    @pytest.mark.parametrize("separator", ["\r", "\x0c", "\u2028"])
+    def test_other_line_separators(self, separator):
+        """Any separator str.splitlines() recognises ends a line."""
+        spec = load_agent_spec_from_text(SPEC.replace("\n", separator) + "Next.")
+        assert spec.tools == ("search", "fetch")
+        assert spec.prompt == "You are helpful.\nNext."
+
+    def test_delimiters_with_surrounding_whitespace(self):
+        spec = load_agent_spec_from_text(" --- \nname: Helper\ntools: [search]\n\t---\t\nBody")
+        assert spec.tools == ("search",)
+        assert spec.prompt == "Body"
+
+    def test_empty_text(self):
+        with pytest.raises(AgentSpecError, match="is empty"):
+            load_agent_spec_from_text("")
+
+    def test_missing_opening_delimiter(self):
+        with pytest.raises(AgentSpecError, match="missing YAML frontmatter"):
+            load_agent_spec_from_text("name: Helper\n---\nBody")
+
+    def test_opening_delimiter_must_be_first_non_blank_line(self):
+        with pytest.raises(AgentSpecError, match="missing YAML frontmatter"):
+            load_agent_spec_from_text("Intro\n" + SPEC)
+
+    def test_missing_closing_delimiter(self):
+        with pytest.raises(AgentSpecError, match="missing closing"):
+            load_agent_spec_from_text("---\nname: Helper\ntools: [search]\nBody")
+
+    def test_empty_body(self):
+        with pytest.raises(AgentSpecError, match="prompt body is empty"):
+            load_agent_spec_from_text("---\nname: Helper\ntools: [search]\n---\n  \n")
+
+    def test_tab_indented_yaml_rejected(self):
+        """Tab indentation is invalid YAML regardless of the loader backend."""
+        with pytest.raises(AgentSpecError, match="invalid YAML"):
+            load_agent_spec_from_text("---\nname:\tHelper\ntools: [search]\n---\nBody")
+
+
+class TestMetadata:
+    """Test validation of frontmatter fields."""
+
+    def test_frontmatter_must_be_mapping(self):
+        with pytest.raises(AgentSpecError, match="must be a mapping"):
+            load_agent_spec_from_text("---\n- a\n- b\n---\nBody")
+
+    def test_name_required(self):
+        with pytest.raises(AgentSpecError, match="string 'name'"):
+            load_agent_spec_from_text("---\ntools: [search]\n---\nBody")
+
+    def test_tools_are_stripped(self):
+        spec = load_agent_spec_from_text("---\nname: ' Helper '\ntools: [' search ']\n---\nBody")
+        assert spec.name == "Helper"
+        assert spec.tools == ("search",)
+
+    @pytest.mark.parametrize("tools", ["[]", "search", "[search, 3]", "[search, '  ']", "[search, null]"])
+    def test_invalid_tools(self, tools):
+        with pytest.raises(AgentSpecError, match="list 'tools'"):
+            load_agent_spec_from_text(f"---\nname: Helper\ntools: {tools}\n---\nBody")
+
+
+class TestLoadAgentSpec:
+    """Test loading specs from disk."""
+
+    def test_reload_after_rewrite(self, tmp_path):
+        path = tmp_path / "helper.md"
+        path.write_text(SPEC)
+        assert load_agent_spec(path).tools == ("search", "fetch")
+
+        path.write_text(SPEC.replace("  - fetch\n", ""))
+        # Make sure the rewrite is visible even on filesystems with coarse timestamps
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        spec = load_agent_spec(path)
+        assert spec.tools == ("search",)
+        assert spec.source_path == path
+
+    def test_list_agent_files_sees_new_files(self, tmp_path):
+        """New files show up immediately, even within one directory timestamp tick."""
+        (tmp_path / "b.md").write_text(SPEC)
+        (tmp_path / "notes.txt").write_text("ignored")
+        assert list_agent_files(tmp_path) == [tmp_path / "b.md"]
+
+        mtime_ns = tmp_path.stat().st_mtime_ns
+        (tmp_path / "a.MD").write_text(SPEC)
+        os.utime(tmp_path, ns=(tmp_path.stat().st_atime_ns, mtime_ns))
+        assert list_agent_files(tmp_path) == [tmp_path / "a.MD", tmp_path / "b.md"]
+
+    def test_missing_directory(self, tmp_path):
+        with pytest.raises(AgentSpecError, match="not found"):
+            list_agent_files(Path(tmp_path / "missing"))
@@ -141,6 +141,27 @@ class TestBaseProviderKeyMethods:
             
             assert provider.is_configured is False
 
+    def test_get_model_info_sees_replaced_models(self):
+        """get_model_info should pick up a new model list assigned to the config."""
+        from src.archi.providers.base import ModelInfo, ProviderConfig, ProviderType
+        from src.archi.providers.openai_provider import OpenAIProvider
+        
+        model_a = ModelInfo(id="a", name="a", display_name="A")
+        model_b = ModelInfo(id="b", name="b", display_name="B")
+        config = ProviderConfig(provider_type=ProviderType.OPENAI, api_key="k", models=[model_a])
+        provider = OpenAIProvider(config)
+        
+        assert provider.get_model_info("a") is model_a
+        assert provider.get_model_info("b") is None
+        
+        # The list is frozen, so in-place edits cannot bypass the index
+        assert isinstance(config.models, tuple)
+        with pytest.raises(AttributeError):
+            config.models.append(model_b)
+        
+        config.models = config.models + (model_b,)
+        assert provider.get_model_info("b") is model_b
+
 
 class TestProviderDisplayNames:
     """Test that providers have correct display names."""
@@ -218,3 +239,155 @@ class TestModelInfo:
         assert d["supports_tools"] is True
         assert d["supports_streaming"] is True
         assert d["supports_vision"] is True
+
+
+class _FakeUsersCursor:
+    """Minimal cursor over an in-memory users table for UserService API key queries."""
+    
+    def __init__(self, db):
+        self.db = db
+        self.rowcount = 0
+        self._row = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def execute(self, sql, params):
+        self.db.queries.append(sql)
+        if "pgp_sym_encrypt" in sql:
+            api_key, _, user_id = params
+            self.rowcount = self.db.set_key(user_id, sql, api_key)
+        elif sql.lstrip().startswith("UPDATE"):
+            self.rowcount = self.db.set_key(params[0], sql, None)
+        else:
+            cached_updated_at, _, user_id = params
+            user = self.db.users.get(user_id)
+            column = sql.split("pgp_sym_decrypt(")[1].split(",")[0]
+            if user is None or user.get(column) is None:
+                self._row = None
+            elif user["updated_at"] == cached_updated_at:
+                self._row = (user["updated_at"], None)
+            else:
+                self.db.decrypts += 1
+                self._row = (user["updated_at"], user[column].encode("utf-8"))
+    
+    def fetchone(self):
+        return self._row
+
+
+class _FakeUsersDB:
+    """In-memory users table; updated_at is bumped on every write like NOW()."""
+    
+    def __init__(self):
+        self.users = {"user-1": {"updated_at": 0}}
+        self.queries = []
+        self.decrypts = 0
+        self._clock = 0
+    
+    def set_key(self, user_id, sql, api_key):
+        if user_id not in self.users:
+            return 0
+        column = sql.split("SET")[1].split("=")[0].strip()
+        self._clock += 1
+        self.users[user_id][column] = api_key
+        self.users[user_id]["updated_at"] = self._clock
+        return 1
+    
+    def service(self, encryption_key="test-key"):
+        from src.utils.user_service import UserService
+        
+        conn = MagicMock()
+        conn.cursor.side_effect = lambda: _FakeUsersCursor(self)
+        pool = MagicMock()
+        pool.get_connection.return_value = conn
+        return UserService(connection_pool=pool, encryption_key=encryption_key)
+
+
+class TestApiKeyCache:
+    """Test the process-wide cache of decrypted BYOK keys."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from src.utils import user_service
+        
+        user_service._API_KEY_CACHE.clear()
+        yield
+        user_service._API_KEY_CACHE.clear()
+    
+    def test_hit_skips_decryption(self):
+        """A second read of an unchanged key should not decrypt again."""
+        db = _FakeUsersDB()
+        db.service().set_api_key("user-1", "openai", "sk-one")
+        
+        reader = db.service()
+        assert reader.get_api_key("user-1", "openai") == "sk-one"
+        db.queries.clear()
+        assert reader.get_api_key("user-1", "openai") == "sk-one"
+        assert db.decrypts == 1
+        # The freshness check and the decryption share one statement
+        assert len(db.queries) == 1
+    
+    def test_changed_updated_at_expires_entry(self):
+        """A write from another process (bumped updated_at) should force a re-read."""
+        db = _FakeUsersDB()
+        service = db.service()
+        service.set_api_key("user-1", "openai", "sk-one")
+        assert service.get_api_key("user-1", "openai") == "sk-one"
+        
+        # Simulate another worker rotating the key without touching this process' cache
+        db.users["user-1"]["api_key_openai"] = "sk-two"
+        db.users["user-1"]["updated_at"] += 1
+        
+        assert service.get_api_key("user-1", "openai") == "sk-two"
+        assert db.decrypts == 2
+    
+    def test_cache_is_per_encryption_key(self):
+        """A key decrypted with one encryption key is not served to a service using another."""
+        db = _FakeUsersDB()
+        db.service().set_api_key("user-1", "openai", "sk-one")
+        assert db.service().get_api_key("user-1", "openai") == "sk-one"
+        
+        assert db.service(encryption_key="other-key").get_api_key("user-1", "openai") == "sk-one"
+        assert db.decrypts == 2
+    
+    def test_misses_are_not_cached(self):
+        """A user who saves a key right after a miss should get it immediately."""
+        db = _FakeUsersDB()
+        reader = db.service()
+        assert reader.get_api_key("user-1", "openai") is None
+        
+        db.service().set_api_key("user-1", "openai", "sk-new")
+        assert reader.get_api_key("user-1", "openai") == "sk-new"
+    
+    def test_set_clears_entry_across_instances(self):
+        """Setting a key through one instance should be visible to another at once."""
+        db = _FakeUsersDB()
+        writer, reader = db.service(), db.service()
+        writer.set_api_key("user-1", "openai", "sk-one")
+        assert reader.get_api_key("user-1", "openai") == "sk-one"
+        
+        writer.set_api_key("user-1", "openai", "sk-two")
+        assert reader.get_api_key("user-1", "openai") == "sk-two"
+    
+    def test_set_none_revokes_key(self):
+        """Setting the key to None (API delete endpoint) should stop serving it."""
+        db = _FakeUsersDB()
+        writer, reader = db.service(), db.service()
+        writer.set_api_key("user-1", "openai", "sk-one")
+        assert reader.get_api_key("user-1", "openai") == "sk-one"
+        
+        writer.set_api_key("user-1", "openai", None)
+        assert reader.get_api_key("user-1", "openai") is None
+    
+    def test_delete_revokes_key(self):
+        """delete_api_key should stop the cached key being served."""
+        db = _FakeUsersDB()
+        writer, reader = db.service(), db.service()
+        writer.set_api_key("user-1", "anthropic", "sk-ant")
+        assert reader.get_api_key("user-1", "anthropic") == "sk-ant"
+        
+        writer.delete_api_key("user-1", "anthropic")
+        assert reader.get_api_key("user-1", "anthropic") is None
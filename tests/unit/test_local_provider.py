@@ -0,0 +1,178 @@
+"""
+Unit tests for the LocalProvider Ollama model cache.
+
+Tests cover:
+- Cache shared by provider instances, keyed by base_url
+- Stale entries served while a background refresh runs
+- Failed refreshes keeping the previous model list
+"""
+
+import sys
+import time
+import types
+
+import pytest
+
+# Minimal stubs so tests can run without langchain-core or requests installed.
+try:
+    import langchain_core.language_models.chat_models  # noqa: F401
+except ImportError:
+    chat_models_module = types.ModuleType("langchain_core.language_models.chat_models")
+    chat_models_module.BaseChatModel = object
+    sys.modules.setdefault("langchain_core", types.ModuleType("langchain_core"))
+    sys.modules.setdefault("langchain_core.language_models", types.ModuleType("langchain_core.language_models"))
+    sys.modules["langchain_core.language_models.chat_models"] = chat_models_module
+
+try:
+    import requests
+except ImportError:
+    requests = types.ModuleType("requests")
+    requests.RequestException = type("RequestException", (IOError,), {})
+    sys.modules["requests"] = requests
+
+from src.archi.providers.base import ProviderConfig, ProviderType
+from src.archi.providers.local_provider import LocalProvider
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.RequestException(f"{self.status_code} Server Error")
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    """Stands in for the shared requests.Session; replays queued responses."""
+
+    def __init__(self):
+        self.responses = []
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class _InlineThread:
+    """Runs the background refresh synchronously so tests can observe it."""
+
+    def __init__(self, target, args=(), **kwargs):
+        self._target = target
+        self._args = args
+
+    def start(self):
+        self._target(*self._args)
+
+
+def _tags(*names):
+    return _FakeResponse(200, {"models": [{"name": name, "details": {}} for name in names]})
+
+
+def _provider(base_url="http://ollama:11434"):
+    return LocalProvider(ProviderConfig(
+        provider_type=ProviderType.LOCAL,
+        base_url=base_url,
+        extra_kwargs={"local_mode": "ollama"},
+    ))
+
+
+def _expire(base_url="http://ollama:11434"):
+    _, models = LocalProvider._ollama_models_cache[base_url]
+    LocalProvider._ollama_models_cache[base_url] = (
+        time.monotonic() - LocalProvider.OLLAMA_MODELS_TTL_SECONDS - 1,
+        models,
+    )
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = _FakeSession()
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    monkeypatch.setattr(LocalProvider, "_http_session", fake)
+    monkeypatch.setattr(LocalProvider, "_ollama_models_cache", {})
+    monkeypatch.setattr(LocalProvider, "_ollama_refreshing", set())
+    monkeypatch.setattr("src.archi.providers.local_provider.threading.Thread", _InlineThread)
+    return fake
+
+
+class TestOllamaModelCache:
+    """Test caching of installed Ollama models across provider instances."""
+
+    def test_fresh_cache_shared_between_instances(self, session):
+        """A fresh provider per request should reuse the cached list."""
+        session.responses = [_tags("llama3")]
+
+        assert [m.id for m in _provider().list_models()] == ["llama3"]
+        assert [m.id for m in _provider().list_models()] == ["llama3"]
+        assert session.urls == ["http://ollama:11434/api/tags"]
+
+    def test_cached_models_cannot_be_modified(self, session):
+        """Callers share the cached sequence, so it must be immutable."""
+        session.responses = [_tags("llama3")]
+
+        models = _provider().list_models()
+        assert isinstance(models, tuple)
+        assert _provider().list_models() is models
+
+    def test_cache_keyed_by_base_url(self, session):
+        """Different servers should not share a model list."""
+        session.responses = [_tags("llama3"), _tags("qwen2")]
+
+        assert [m.id for m in _provider("http://a:11434").list_models()] == ["llama3"]
+        assert [m.id for m in _provider("http://b:11434").list_models()] == ["qwen2"]
+        assert len(session.urls) == 2
+
+    def test_stale_cache_served_and_refreshed(self, session):
+        """A stale list is returned immediately and replaced by the refresh."""
+        session.responses = [_tags("llama3"), _tags("llama3", "qwen2")]
+        _provider().list_models()
+        _expire()
+
+        assert [m.id for m in _provider().list_models()] == ["llama3"]
+        assert len(session.urls) == 2
+        assert [m.id for m in _provider().list_models()] == ["llama3", "qwen2"]
+        assert LocalProvider._ollama_refreshing == set()
+
+    def test_failed_refresh_keeps_previous_list(self, session):
+        """Errors and non-200 responses should not drop the cached models."""
+        session.responses = [
+            _tags("llama3"),
+            requests.RequestException("connection refused"),
+            _FakeResponse(500),
+        ]
+        _provider().list_models()
+
+        for _ in range(2):
+            _expire()
+            assert [m.id for m in _provider().list_models()] == ["llama3"]
+            assert LocalProvider._ollama_refreshing == set()
+        assert len(session.urls) == 3
+
+    def test_failed_first_fetch_falls_back_to_config(self, session):
+        """With nothing cached, a failed fetch falls back to configured models."""
+        session.responses = [_FakeResponse(500)]
+
+        assert list(_provider().list_models()) == []
+        assert "http://ollama:11434" not in LocalProvider._ollama_models_cache
+
+    def test_server_error_is_logged(self, session, monkeypatch):
+        """A 5xx from /api/tags should be reported like a connection error."""
+        warnings = []
+        monkeypatch.setattr(
+            "src.archi.providers.local_provider.logger.warning",
+            lambda message, *args, **kwargs: warnings.append(message),
+        )
+        session.responses = [_FakeResponse(503)]
+
+        assert list(_provider().list_models()) == []
+        assert len(warnings) == 1
+        assert "Failed to fetch Ollama models" in warnings[0]